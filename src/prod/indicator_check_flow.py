@@ -0,0 +1,160 @@
+import copy
+import os
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+
+from src.utils import signals
+from src.utils.signals import algorithm, build_indicator_plan, register_indicator, register_intermediate, BUY, HOLD, SELL
+from src.utils.config import Config
+
+
+# Offline checks of the indicator registry: plan resolution, registration
+# rules, plugin loading, and equivalence with the pre-registry per-indicator
+# code from `start` onward. Raises AssertionError on the first failure.
+
+def _config(**signals_overrides):
+    config = Config()
+    config._cfg = copy.deepcopy(config._cfg)
+    config._cfg["signals"].update(signals_overrides)
+    return config
+
+def _raises(exc, fn, *args, **kwargs):
+    try:
+        fn(*args, **kwargs)
+    except exc:
+        return
+    raise AssertionError(f"{fn.__name__} did not raise {exc.__name__}")
+
+
+# ---- reference: the pre-registry indicators, computed on full history ----
+
+def _legacy_scores(df, config):
+    sc = config.signals
+    close = df["Close"]
+    out = {}
+    s = close.rolling(window=sc["ma_cross"]["short_window"]).mean()
+    l = close.rolling(window=sc["ma_cross"]["long_window"]).mean()
+    out["ma_cross"] = np.where(s > l, 1.0, np.where(s < l, -1.0, 0.0))
+
+    p = sc["rsi_signal"]
+    delta = close.diff()
+    up, down = delta.clip(lower=0), -delta.clip(upper=0)
+    rs = up.ewm(alpha=1/p["period"], adjust=False).mean() / down.ewm(alpha=1/p["period"], adjust=False).mean()
+    rsi = 100 - (100 / (1 + rs))
+    score = pd.Series(0.0, index=df.index)
+    score = score.where(rsi > p["oversold"], (p["oversold"] - rsi) / p["oversold"])
+    score = score.where(rsi < p["overbought"], -(rsi - p["overbought"]) / (100 - p["overbought"]))
+    out["rsi_signal"] = score.clip(-1, 1)
+
+    p = sc["macd_signal"]
+    macd = close.ewm(span=p["fast"], adjust=False).mean() - close.ewm(span=p["slow"], adjust=False).mean()
+    hist = macd - macd.ewm(span=p["signal"], adjust=False).mean()
+    vol = hist.abs().rolling(window=20).quantile(0.95).replace(0, np.nan)
+    out["macd_signal"] = (hist / vol).clip(-1, 1).fillna(0)
+
+    p = sc["bb_signal"]
+    mid = close.rolling(p["period"]).mean()
+    stddev = close.rolling(p["period"]).std()
+    out["bb_signal"] = np.where(close < mid - p["std"] * stddev, 1.0,
+                       np.where(close > mid + p["std"] * stddev, -1.0, 0.0))
+
+    raw = pd.concat([pd.Series(out[n], index=df.index) for n in sc["indicators"]], axis=1).mean(axis=1)
+    sig = np.where(raw > sc["score_threshold_buy"], BUY, np.where(raw < sc["score_threshold_sell"], SELL, HOLD))
+    return pd.Series(sig, index=df.index).shift(1, fill_value=HOLD), raw.shift(1)
+
+
+rng = np.random.default_rng(7)
+n = 1500
+idx = pd.bdate_range("2018-01-01", periods=n)
+close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+df = pd.DataFrame({
+    "Open": close * (1 + rng.normal(0, 0.003, n)),
+    "High": close * (1 + np.abs(rng.normal(0, 0.01, n))),
+    "Low": close * (1 - np.abs(rng.normal(0, 0.01, n))),
+    "Close": close,
+    "Volume": rng.integers(100_000, 5_000_000, n).astype(float),
+}, index=idx)
+start, end = idx[1000], idx[-1]
+
+
+# ---- plan resolution ----
+config = _config(indicators=["ma_cross", "macd_signal", "bb_signal", "rsi_signal"])
+order, lookback = build_indicator_plan(config.signals["indicators"], config)
+assert len(order) == len(set(order)), order
+assert order.index(("true_range",)) < order.index(("atr", 14))
+assert order.index(("ema", 12)) < order.index(("macd", 12, 26))
+assert order.index(("ema", 26)) < order.index(("macd", 12, 26))
+assert lookback == 200, lookback
+
+# ma_cross short window and bb period both ask for ("sma", 20): computed once
+shared = _config(indicators=["ma_cross", "bb_signal"], ma_cross={"short_window": 20, "long_window": 50})
+order, _ = build_indicator_plan(shared.signals["indicators"], shared)
+assert order.count(("sma", 20)) == 1, order
+
+_raises(KeyError, build_indicator_plan, ["no_such_indicator"], config)
+
+register_indicator("_check_unknown_dep", intermediates=lambda p: [("no_such_intermediate",)])(lambda df, p, inter: 0.0)
+_raises(KeyError, build_indicator_plan, ["_check_unknown_dep"], config)
+
+register_intermediate("_check_cycle_a", deps=lambda: [("_check_cycle_b",)])(lambda df, inter: None)
+register_intermediate("_check_cycle_b", deps=lambda: [("_check_cycle_a",)])(lambda df, inter: None)
+register_indicator("_check_cycle", intermediates=lambda p: [("_check_cycle_a",)])(lambda df, p, inter: 0.0)
+_raises(ValueError, build_indicator_plan, ["_check_cycle"], config)
+
+# ---- registration rules ----
+_raises(ValueError, register_intermediate, "sma")
+_raises(ValueError, register_indicator, "ma_cross")
+sma = signals._INTERMEDIATE_REGISTRY["sma"]
+register_intermediate("sma", override=True)(sma["fn"])
+assert signals._INTERMEDIATE_REGISTRY["sma"]["fn"] is sma["fn"]
+
+# ---- trim point and equivalence with the pre-registry code ----
+for inds in (["ma_cross", "macd_signal", "bb_signal"], ["ma_cross", "macd_signal", "bb_signal", "rsi_signal"]):
+    config = _config(indicators=inds)
+    snapshot = df.copy()
+    out = algorithm(df, start, end, config)
+    assert df.equals(snapshot), "algorithm() modified its input"
+    assert out.index[0] == start and out.index[-1] == end, (out.index[0], out.index[-1])
+
+    ref_signal, ref_score = _legacy_scores(df, config)
+    mismatches = int((ref_signal.loc[start:] != out["Signal"]).sum())
+    score_err = float((ref_score.loc[start:] - out["Score"]).abs().max())
+    assert mismatches == 0, f"{inds}: {mismatches} Signal mismatches from start onward"
+    assert score_err < 1e-6, f"{inds}: Score differs by {score_err}"
+    print(f"{inds} → rows {len(out)}, Signal mismatches 0, max Score diff {score_err:.1e}")
+
+# ---- misaligned plugin results are put back on the input index ----
+@register_indicator("_check_misaligned")
+def _check_misaligned(df, params, inter):
+    # Close as the score, reversed and with the first bars dropped
+    return df["Close"].iloc[::-1].iloc[:-10]
+
+config = _config(indicators=["_check_misaligned"])
+out = algorithm(df, start, end, config)
+assert out["Score"].equals(df["Close"].shift(1).loc[start:].rename("Score"))
+
+# ---- README plugin example, loaded through signals.plugins ----
+plugin_src = '''
+from src.utils.signals import register_indicator
+
+@register_indicator("volume_filter", inputs=("Volume",), lookback=lambda p: p["period"])
+def _volume_filter(df, params, inter):
+    avg = df["Volume"].rolling(params["period"]).mean()
+    return (df["Volume"] > avg).astype(float)
+'''
+with tempfile.TemporaryDirectory() as tmp:
+    with open(os.path.join(tmp, "my_indicators.py"), "w") as f:
+        f.write(plugin_src)
+    sys.path.insert(0, tmp)
+    try:
+        config = _config(plugins=["my_indicators"], indicators=["ma_cross", "volume_filter"], volume_filter={"period": 20})
+        out = algorithm(df, start, end, config)
+    finally:
+        sys.path.remove(tmp)
+assert "volume_filter" in signals._INDICATOR_REGISTRY
+assert out.index[0] == start and out["Score"].notna().all()
+_raises(ValueError, algorithm, df.drop(columns="Volume"), start, end, config)
+
+print("indicator checks passed")
@@ -0,0 +1,93 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+from datetime import date
+from dateutil.relativedelta import relativedelta
+
+from src.utils.signals import algorithm, SIGNAL_LABELS
+from src.utils.backtest import backtest
+from src.utils.config import Config
+
+
+# Synthetic universe over a fixed window so the benchmark runs offline and
+# every run sees the same tickers x bars.
+NUM_TICKERS = 500
+end = date(2025, 10, 24)
+start = end - relativedelta(years=1)
+idx = pd.bdate_range(start, end, inclusive="left")
+n = len(idx)
+
+def _universe():
+    rng = np.random.default_rng(42)
+    ticker_dict = {}
+    for i in range(NUM_TICKERS):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+        ticker_dict[f"T{i:03d}"] = pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, 0.003, n)),
+            "High": close * (1 + np.abs(rng.normal(0, 0.01, n))),
+            "Low": close * (1 - np.abs(rng.normal(0, 0.01, n))),
+            "Close": close,
+            "Volume": rng.integers(100_000, 5_000_000, n),
+        }, index=idx)
+    return ticker_dict
+
+# Frames built from the same input share its index object, so frame totals
+# count it more than once (including the lookup table pandas builds on it
+# once the backtest queries it). Both layouts are measured the same way.
+def _mb(frames):
+    return sum(df.memory_usage(deep=True).sum() for df in frames) / 2**20
+
+def _legacy_signals(input_df, config):
+    """The pre-user-027 layout: columns written into the input frame itself."""
+    out = algorithm(input_df, start, end, config)
+    raw_score = out["Score"].shift(-1).astype("float64")
+    raw_signal = out["Signal"].shift(-1).map(SIGNAL_LABELS).astype(object)
+    input_df["ATR"] = out["ATR_at_Entry"].shift(-1)
+    # one float64 column per indicator, same dtype and shape as before
+    for i, _ in enumerate(config.signals["indicators"]):
+        input_df[f"_score{i}"] = raw_score
+    input_df["RawScore"] = raw_score
+    input_df["RawSignal"] = raw_signal
+    input_df["Signal"] = raw_signal.shift(1)
+    input_df["Score"] = raw_score.shift(1)
+    input_df["ExecPrice"] = input_df["Open"]
+    input_df["ATR_at_Entry"] = input_df["ATR"].shift(1)
+    return input_df
+
+config = Config()
+
+# ---- before: mutate the inputs, then backtest() deep-copies them ----
+legacy_inputs = _universe()
+tracemalloc.start()
+legacy_signals = {k: _legacy_signals(v, config) for k, v in legacy_inputs.items()}
+legacy_copies = {k: v.copy() for k, v in legacy_signals.items()}
+_, legacy_peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+legacy_mb = _mb(legacy_inputs.values()) + _mb(legacy_copies.values())
+del legacy_inputs, legacy_signals, legacy_copies
+
+# ---- after: read-only inputs, separate signal frames, no copy ----
+ticker_dict = _universe()
+snapshots = {k: v.copy() for k, v in ticker_dict.items()}
+input_mb = _mb(ticker_dict.values())
+tracemalloc.start()
+signals_dict = {k: algorithm(v, start, end, config) for k, v in ticker_dict.items()}
+backtest_input = dict(signals_dict)  # what backtest() now does instead of v.copy()
+_, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+lean_mb = input_mb + _mb(signals_dict.values())
+inputs_untouched = all(v.equals(snapshots[k]) for k, v in ticker_dict.items())
+
+res = backtest(signals_dict, config)
+
+print("\n" + "="*60)
+print("SIGNAL MEMORY BENCHMARK")
+print("="*60)
+print(f"Tickers x bars → {NUM_TICKERS} x {n}")
+print(f"Score dtype → {config.signals.get('score_dtype') or 'float64'}")
+print(f"Input frames → {input_mb:,.1f} MB")
+print(f"Inputs + signal data → before {legacy_mb:,.1f} MB, after {lean_mb:,.1f} MB")
+print(f"Peak traced (signals + backtest input) → before {legacy_peak / 2**20:,.1f} MB, after {peak / 2**20:,.1f} MB")
+print(f"Inputs untouched → {inputs_untouched}")
+print(f"Trades → {res['summary'].get('Trades', 0)}")
+print("="*60 + "\n")
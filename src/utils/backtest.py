@@ -11,10 +11,11 @@ from .signals import algorithm
 from .exec import execute_user_for_date
 
 def backtest(signals_dict_or_df,config):
+    # Signal frames are only read from here on, so they are used as-is.
     if isinstance(signals_dict_or_df,pd.DataFrame):
-        signals_dict = {"TICKER": signals_dict_or_df.copy()}
+        signals_dict = {"TICKER": signals_dict_or_df}
     else:
-        signals_dict = {k: v.copy() for k, v in signals_dict_or_df.items()}
+        signals_dict = dict(signals_dict_or_df)
     
     all_dates = sorted(set().union(*[df.index for df in signals_dict.values()]))
     port = Portfolio(config,signals_dict)
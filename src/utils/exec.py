@@ -6,6 +6,8 @@ import yfinance as yf
 from datetime import date, timedelta
 from typing import Dict, List, Tuple
 
+from .signals import BUY, SELL
+
 
 def _collect_signal_trades(signals_dict: Dict[str, pd.DataFrame],posture: dict,trade_date: date,top_n_buys: int):
     todays_buys_candidates = []
@@ -17,9 +19,9 @@ def _collect_signal_trades(signals_dict: Dict[str, pd.DataFrame],posture: dict,t
         sig = row["Signal"]
         exec_px = row["ExecPrice"]
         score = float(row["Score"]) if not pd.isna(row["Score"]) else 0.0
-        if sig == "Buy" and posture.get(tkr, 0) == 0: #Buy only if you don't already have that stock
+        if sig == BUY and posture.get(tkr, 0) == 0: #Buy only if you don't already have that stock
             todays_buys_candidates.append((tkr, exec_px, score))
-        elif sig == "Sell" and posture.get(tkr, 0) == 1:  # Sell only if you already have that stock ie no shorting 
+        elif sig == SELL and posture.get(tkr, 0) == 1:  # Sell only if you already have that stock ie no shorting 
             todays_sells.append((tkr, exec_px))
     
     if todays_buys_candidates:
@@ -1,22 +1,129 @@
 #signals
+import importlib
 import numpy as np
 import pandas as pd 
 from dateutil.relativedelta import relativedelta
 
 
 
-def _ma_cross(df: pd.DataFrame, config) -> pd.Series:
+# Signal codes stored (as int8) in the ``Signal`` column of algorithm() output.
+BUY, HOLD, SELL = 1, 0, -1
+SIGNAL_LABELS = {BUY: "Buy", HOLD: "Hold", SELL: "Sell"}
+
+
+# Registries. Intermediates are shared building blocks (rolling means, EMAs,
+# true range ...) keyed by ``(name, *args)`` so that two indicators asking for
+# the same key get the same Series. Indicators declare the columns they read,
+# the intermediates they need and their warm-up lookback, all as functions of
+# their params block in ``config.signals[<name>]``.
+_INTERMEDIATE_REGISTRY = {}
+_INDICATOR_REGISTRY = {}
+
+# EWM-based intermediates have infinite memory; give them this many spans of
+# history so the seed value has decayed away.
+_EWM_WARMUP = 5
+
+
+def _check_new_name(registry, kind, name, override):
+    if name in registry and not override:
+        raise ValueError(f"{kind} '{name}' is already registered; pass override=True to replace it")
+
+
+def register_intermediate(name, inputs=("Close",), deps=None, override=False):
+    """Register ``fn(df, inter, *args)`` as intermediate ``name``.
+
+    ``deps(*args)`` returns the intermediate keys ``fn`` reads from ``inter``.
+    Replacing an existing name requires ``override=True``.
+    """
+    _check_new_name(_INTERMEDIATE_REGISTRY, "Intermediate", name, override)
+    def deco(fn):
+        _INTERMEDIATE_REGISTRY[name] = {
+            "fn": fn,
+            "inputs": tuple(inputs),
+            "deps": deps or (lambda *args: []),
+        }
+        return fn
+    return deco
+
+
+def register_indicator(name, inputs=("Close",), lookback=None, intermediates=None, override=False):
+    """Register ``fn(df, params, inter)`` as indicator ``name``.
+
+    ``lookback(params)`` is the warm-up in bars and ``intermediates(params)``
+    the intermediate keys ``fn`` reads from ``inter``. The returned score
+    should lie in -1 … +1, as an array or a Series on ``df.index``.
+    Replacing an existing name requires ``override=True``.
+    """
+    _check_new_name(_INDICATOR_REGISTRY, "Indicator", name, override)
+    def deco(fn):
+        _INDICATOR_REGISTRY[name] = {
+            "fn": fn,
+            "inputs": tuple(inputs),
+            "lookback": lookback or (lambda params: 0),
+            "intermediates": intermediates or (lambda params: []),
+        }
+        return fn
+    return deco
+
+
+# ---- shared intermediates ----
+
+@register_intermediate("sma")
+def _sma(df, inter, window):
+    return df["Close"].rolling(window=window).mean()
+
+@register_intermediate("rolling_std")
+def _rolling_std(df, inter, window):
+    return df["Close"].rolling(window=window).std()
+
+@register_intermediate("ema")
+def _ema(df, inter, span):
+    return df["Close"].ewm(span=span, adjust=False).mean()
+
+@register_intermediate("delta")
+def _delta(df, inter):
+    return df["Close"].diff()
+
+@register_intermediate("macd", deps=lambda fast, slow: [("ema", fast), ("ema", slow)])
+def _macd(df, inter, fast, slow):
+    return inter[("ema", fast)] - inter[("ema", slow)]
+
+@register_intermediate("true_range", inputs=("High", "Low", "Close"))
+def _true_range(df, inter):
+    high_low = df['High'] - df['Low']
+    high_close = np.abs(df['High'] - df['Close'].shift())
+    low_close = np.abs(df['Low'] - df['Close'].shift())
+    return pd.concat([high_low,high_close,low_close],axis=1).max(axis=1)
+
+@register_intermediate("atr", inputs=(), deps=lambda period: [("true_range",)])
+def _atr(df, inter, period):
+    return inter[("true_range",)].rolling(window=period,min_periods=1).mean()
+
+
+# ---- indicators ----
+
+@register_indicator(
+    "ma_cross",
+    lookback=lambda p: p['long_window'],
+    intermediates=lambda p: [("sma", p['short_window']), ("sma", p['long_window'])],
+)
+def _ma_cross(df: pd.DataFrame, params, inter) -> pd.Series:
     """+1 when short > long, -1 when short < long, 0 otherwise."""
-    s = df["Close"].rolling(window=config.signals["ma_cross"]['short_window']).mean()
-    l = df["Close"].rolling(window=config.signals["ma_cross"]['long_window']).mean()
+    s = inter[("sma", params['short_window'])]
+    l = inter[("sma", params['long_window'])]
     return np.where(s > l, 1.0, np.where(s < l, -1.0, 0.0))
 
-def _rsi_signal(df: pd.DataFrame, config) -> pd.Series:
+@register_indicator(
+    "rsi_signal",
+    lookback=lambda p: _EWM_WARMUP * (2 * p['period'] - 1),
+    intermediates=lambda p: [("delta",)],
+)
+def _rsi_signal(df: pd.DataFrame, params, inter) -> pd.Series:
     """Scale RSI to -1 … +1 (oversold → +1, overbought → -1)."""
-    delta = df["Close"].diff()
-    period = config.signals["rsi_signal"]['period']
-    oversold = config.signals["rsi_signal"]['oversold']
-    overbought = config.signals["rsi_signal"]['overbought']
+    delta = inter[("delta",)]
+    period = params['period']
+    oversold = params['oversold']
+    overbought = params['overbought']
 
     up, down = delta.clip(lower=0), -delta.clip(upper=0)
     roll_up   = up.ewm(alpha=1/period, adjust=False).mean()
@@ -29,75 +136,159 @@ def _rsi_signal(df: pd.DataFrame, config) -> pd.Series:
     score = score.where(rsi < overbought, -(rsi - overbought) / (100 - overbought))
     return score.clip(-1, 1)
 
-def _macd_signal(df: pd.DataFrame,config) -> pd.Series:
+@register_indicator(
+    "macd_signal",
+    lookback=lambda p: _EWM_WARMUP * p['slow'] + p['signal'] + 20,
+    intermediates=lambda p: [("macd", p['fast'], p['slow'])],
+)
+def _macd_signal(df: pd.DataFrame, params, inter) -> pd.Series:
     """Normalised MACD histogram → -1 … +1."""
-    signal = config.signals["macd_signal"]['signal']
-    fast = config.signals["macd_signal"]['fast']
-    slow = config.signals["macd_signal"]['slow']
-    e1 = df["Close"].ewm(span=fast,  adjust=False).mean()
-    e2 = df["Close"].ewm(span=slow,  adjust=False).mean()
-    macd = e1 - e2
-    sig  = macd.ewm(span=signal, adjust=False).mean()
+    macd = inter[("macd", params['fast'], params['slow'])]
+    sig  = macd.ewm(span=params['signal'], adjust=False).mean()
     hist = macd - sig
     # simple normalisation by recent volatility
     vol = hist.abs().rolling(window=20).quantile(0.95).replace(0, np.nan)
     return (hist / vol).clip(-1, 1).fillna(0)
 
-def _bb_signal(df: pd.DataFrame, config) -> pd.Series:
+@register_indicator(
+    "bb_signal",
+    lookback=lambda p: p['period'],
+    intermediates=lambda p: [("sma", p['period']), ("rolling_std", p['period'])],
+)
+def _bb_signal(df: pd.DataFrame, params, inter) -> pd.Series:
     """BB: +1 oversold (below lower), -1 overbought (above upper)."""
-    period = config.signals["bb_signal"]['period']
-    std = config.signals["bb_signal"]['std']
-    mid = df["Close"].rolling(period).mean()
-    stddev = df["Close"].rolling(period).std()
+    std = params['std']
+    mid = inter[("sma", params['period'])]
+    stddev = inter[("rolling_std", params['period'])]
     upper = mid + std * stddev
     lower = mid - std * stddev
     return np.where(df["Close"] < lower, 1.0,
            np.where(df["Close"] > upper, -1.0, 0.0))
 
-def _atr(df: pd.DataFrame, config) -> pd.Series:
-    high_low = df['High'] - df['Low']
-    high_close = np.abs(df['High'] - df['Close'].shift())
-    low_close = np.abs(df['Low'] - df['Close'].shift())
-    tr = pd.concat([high_low,high_close,low_close],axis=1).max(axis=1)
-    return tr.rolling(window=config.signals['atr_signal']['period'],min_periods=1).mean()
 
+# ---- engine ----
+
+def _load_plugins(config):
+    """Import the modules in ``signals.plugins``; they register on import."""
+    for mod in config.signals.get("plugins") or []:
+        importlib.import_module(mod)
 
-_INDICATOR_MAP = {
-    "ma_cross": _ma_cross,
-    "rsi_signal": _rsi_signal,
-    "macd_signal": _macd_signal,
-    "bb_signal": _bb_signal,
-}
+def _indicator_params(name, config):
+    return config.signals.get(name) or {}
+
+def _check_inputs(df, inputs, what):
+    missing = [c for c in inputs if c not in df.columns]
+    if missing:
+        raise ValueError(f"{what} needs columns {missing} which are not in the input data")
+
+def build_indicator_plan(ind_list, config):
+    """Resolve ``ind_list`` against the registry.
+
+    Returns the intermediate keys in dependency order (each listed once) and
+    the largest warm-up lookback over the indicators and ATR.
+    """
+    atr_period = config.signals['atr_signal']['period']
+    roots = [("atr", atr_period)]
+    lookback = atr_period
+    for name in ind_list:
+        if name not in _INDICATOR_REGISTRY:
+            raise KeyError(f"Unknown indicator '{name}'. Registered: {sorted(_INDICATOR_REGISTRY)}")
+        spec = _INDICATOR_REGISTRY[name]
+        params = _indicator_params(name, config)
+        roots.extend(spec["intermediates"](params))
+        lookback = max(lookback, int(spec["lookback"](params)))
+
+    order, state = [], {}
+    def visit(key):
+        if state.get(key) == "done":
+            return
+        if state.get(key) == "visiting":
+            raise ValueError(f"Cycle in indicator intermediates at {key}")
+        if key[0] not in _INTERMEDIATE_REGISTRY:
+            raise KeyError(f"Unknown intermediate '{key[0]}'. Registered: {sorted(_INTERMEDIATE_REGISTRY)}")
+        state[key] = "visiting"
+        for dep in _INTERMEDIATE_REGISTRY[key[0]]["deps"](*key[1:]):
+            visit(dep)
+        state[key] = "done"
+        order.append(key)
+    for key in roots:
+        visit(key)
+    return order, lookback
+
+def _compute_intermediates(df, order):
+    inter = {}
+    for key in order:
+        spec = _INTERMEDIATE_REGISTRY[key[0]]
+        _check_inputs(df, spec["inputs"], f"Intermediate {key}")
+        inter[key] = spec["fn"](df, inter, *key[1:])
+    return inter
+
+def _align_score(res, index, name):
+    """Put an indicator result on ``index`` as float64 values."""
+    if isinstance(res, pd.Series):
+        return res.reindex(index).to_numpy(dtype="float64")
+    res = np.asarray(res, dtype="float64")
+    if res.shape != (len(index),):
+        raise ValueError(f"Indicator '{name}' returned shape {res.shape}, expected ({len(index)},)")
+    return res
+
+def _trim_history(df, start, lookback):
+    """Drop rows older than ``lookback`` bars before ``start``."""
+    if start is None:
+        return df
+    lo = df.index.searchsorted(pd.Timestamp(start)) - lookback
+    if lo <= 0:
+        return df
+    return df.iloc[lo:]
 
 
 def algorithm(input_df,start,end,config,interval='1d'):
+    """Score ``input_df`` and return a separate signal frame.
+
+    ``input_df`` is only read. History before ``start`` is used for warm-up
+    only; the result covers ``start`` onward and holds
+    ``Close``, ``ExecPrice``, ``Signal`` (int8 ``BUY``/``HOLD``/``SELL``),
+    ``Score`` (``signals.score_dtype``, default float64) and ``ATR_at_Entry``,
+    with Signal/Score/ATR lagged one bar so they act on the next open.
+    """
     if input_df.empty:
         return None
-    input_df["ATR"] = _atr(input_df,config)
+    _load_plugins(config)
     ind_list = config.signals["indicators"]
+    order, lookback = build_indicator_plan(ind_list, config)
+    input_df = _trim_history(input_df, start, lookback)
+    inter = _compute_intermediates(input_df, order)
+
     scores = []
-    for i, fn in enumerate(ind_list):
-        col = f"_score{i}"
-        input_df[col] = _INDICATOR_MAP[fn](input_df,config)
-        scores.append(input_df[col])
+    for name in ind_list:
+        spec = _INDICATOR_REGISTRY[name]
+        _check_inputs(input_df, spec["inputs"], f"Indicator '{name}'")
+        res = spec["fn"](input_df, _indicator_params(name, config), inter)
+        scores.append(_align_score(res, input_df.index, name))
 
     # Aggregate score = simple average
-    score_df = pd.concat(scores, axis=1)
-    input_df["RawScore"] = score_df.mean(axis=1)
-    input_df["RawSignal"] = np.where(input_df["RawScore"] > config.signals["score_threshold_buy"], "Buy",
-                           np.where(input_df["RawScore"] < config.signals["score_threshold_sell"], "Sell", "Hold"))
-    input_df["Signal"] = input_df["RawSignal"].shift(1)
-    input_df["Score"] = input_df["RawScore"].shift(1)
-    input_df["ExecPrice"] = input_df["Open"]
-    
-    input_df["ATR_at_Entry"] = input_df["ATR"].shift(1)
-    return input_df
+    raw_score = pd.DataFrame(np.column_stack(scores), index=input_df.index).mean(axis=1)
+    raw_signal = np.where(raw_score > config.signals["score_threshold_buy"], BUY,
+                 np.where(raw_score < config.signals["score_threshold_sell"], SELL, HOLD)).astype(np.int8)
+    score_dtype = config.signals.get("score_dtype") or "float64"
+
+    out = pd.DataFrame({
+        "Close": input_df["Close"],
+        "ExecPrice": input_df["Open"],
+        "Signal": pd.Series(raw_signal, index=input_df.index).shift(1, fill_value=HOLD),
+        "Score": raw_score.shift(1).astype(score_dtype),
+        "ATR_at_Entry": inter[("atr", config.signals['atr_signal']['period'])].shift(1),
+    }, index=input_df.index)
+    # Warm-up rows were scored on cut-off history; never hand them to a consumer.
+    if start is not None:
+        out = out.iloc[out.index.searchsorted(pd.Timestamp(start)):]
+    return out
 
 
 
 def get_buy_list_for_date(signals_dict, trade_date):
     tickers = []
     for tkr, sdf in signals_dict.items():
-        if trade_date in sdf.index and str(sdf.loc[trade_date, "Signal"]) == "Buy":
+        if trade_date in sdf.index and sdf.loc[trade_date, "Signal"] == BUY:
             tickers.append(tkr)
     return sorted(tickers)
\ No newline at end of file